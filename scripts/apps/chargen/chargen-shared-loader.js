@@ -0,0 +1,22 @@
+/**
+ * Lazy loader for chargen-shared.js
+ *
+ * Callers that only need chargen-shared.js on demand (random names, opponent
+ * profiles) load it through here and share one pending import. A rejected
+ * load is not cached, so the next call retries.
+ */
+
+let chargenSharedModulePromise = null;
+
+/**
+ * Load the chargen-shared.js module, reusing the in-flight or settled promise.
+ * @returns {Promise<object>} The chargen-shared.js module namespace
+ */
+export function loadChargenShared() {
+  chargenSharedModulePromise ??= import('/systems/foundryvtt-swse/scripts/apps/chargen/chargen-shared.js')
+    .catch(err => {
+      chargenSharedModulePromise = null;
+      throw err;
+    });
+  return chargenSharedModulePromise;
+}
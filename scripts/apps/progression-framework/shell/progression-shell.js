@@ -92,6 +92,9 @@ import { PROGRESSION_NODE_REGISTRY, InvalidationBehavior } from '../../../engine
  */
 export const FOCUSED_ROW_CLASSES = Object.freeze(['is-focused', 'focused']);
 
+/** Window in which a repeated Next-blocking warning is not re-toasted. */
+const BLOCKING_NOTICE_REPEAT_MS = 2000;
+
 export class ProgressionShell extends SWSEApplicationV2 {
   static DEFAULT_OPTIONS = {
     ...SWSEApplicationV2.DEFAULT_OPTIONS,
@@ -307,6 +310,10 @@ export class ProgressionShell extends SWSEApplicationV2 {
     this._autoAdvanceToken = 0;
     this._autoAdvanceNotice = null;
 
+    // Last Next-blocking warning shown, so repeated clicks on a blocked step
+    // do not stack identical toasts.
+    this._lastBlockingNotice = null;
+
     // Mentor state — initialize with Ol' Salty portrait loaded from mentor data
     this._initializeMentorState();
 
@@ -3928,6 +3935,14 @@ export class ProgressionShell extends SWSEApplicationV2 {
     await this.navigateToStep(stepIndex, { source: 'footer-chip' });
   }
 
+  _notifyBlockingIssue(message) {
+    const now = Date.now();
+    const last = this._lastBlockingNotice;
+    if (last && last.message === message && now - last.at < BLOCKING_NOTICE_REPEAT_MS) return;
+    this._lastBlockingNotice = { message, at: now };
+    ui.notifications.warn(message);
+  }
+
   async _onNextStep(event, target) {
     if (target) this._cancelAutoAdvance('manual-next');
     if (this.isProcessing) return;
@@ -3948,7 +3963,7 @@ export class ProgressionShell extends SWSEApplicationV2 {
         blockingIssues = ['This step could not be validated. Please try again.'];
       }
       if (blockingIssues.length > 0) {
-        ui.notifications.warn(blockingIssues[0]);
+        this._notifyBlockingIssue(blockingIssues[0]);
         return;
       }
       await currentPlugin.onStepExit(this, { direction: 'forward' });
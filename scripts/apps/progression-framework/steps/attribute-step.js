@@ -5,6 +5,7 @@
 import { ProgressionStepPlugin } from './step-plugin-base.js';
 import { HouseRuleService } from '/systems/foundryvtt-swse/scripts/engine/system/HouseRuleService.js';
 import { SettingsHelper } from '/systems/foundryvtt-swse/scripts/utils/settings-helper.js';
+import { swseLogger } from '/systems/foundryvtt-swse/scripts/utils/logger.js';
 import { AttributeMentorDialog } from '/systems/foundryvtt-swse/scripts/apps/progression-framework/dialogs/attribute-mentor-dialog.js';
 import {
   buildAttributePlanningProfile,
@@ -30,6 +31,43 @@ const POINT_BUY_COST = Object.freeze({
   18: 16
 });
 
+// Points spent to raise a score from POINT_BUY_BASE, resolved once per score
+// so tallying a spread is a plain lookup per ability.
+const POINT_BUY_SPEND = Object.freeze(Object.fromEntries(
+  Object.entries(POINT_BUY_COST).map(([score, cost]) => [score, cost - POINT_BUY_COST[POINT_BUY_BASE]])
+));
+const POINT_BUY_MAX_SPEND = POINT_BUY_SPEND[18];
+
+function pointBuySpend(value) {
+  const score = Number(value);
+  if (!Number.isFinite(score) || score <= 0) return 0;
+  return POINT_BUY_SPEND[score] ?? POINT_BUY_MAX_SPEND;
+}
+
+const ABILITY_NAMES = Object.freeze({
+  __proto__: null,
+  str: 'Strength',
+  dex: 'Dexterity',
+  con: 'Constitution',
+  int: 'Intelligence',
+  wis: 'Wisdom',
+  cha: 'Charisma',
+});
+
+const ABILITY_SHORT_LABELS = Object.freeze({
+  __proto__: null,
+  str: 'STR',
+  dex: 'DEX',
+  con: 'CON',
+  int: 'INT',
+  wis: 'WIS',
+  cha: 'CHA',
+});
+
+function abilityShortLabel(key) {
+  return ABILITY_SHORT_LABELS[key] ?? String(key || '').toUpperCase();
+}
+
 /** Default attribute generation config (actor / non-droid). */
 export const ACTOR_ATTRIBUTE_GENERATION_CONFIG = Object.freeze({
   abilityCount: 6,
@@ -74,6 +112,17 @@ function rollDie(sides = 6) {
 }
 
 function rollNd6DropLowest(n = 4, dropLowest = 1) {
+  if (dropLowest === 1) {
+    // 4d6-drop-lowest: track the low die instead of building and sorting an array.
+    let sum = 0;
+    let lowest = Infinity;
+    for (let i = 0; i < n; i++) {
+      const roll = rollDie(6);
+      sum += roll;
+      if (roll < lowest) lowest = roll;
+    }
+    return n > 0 ? sum - lowest : 0;
+  }
   const rolls = Array.from({ length: n }, () => rollDie(6)).sort((a, b) => a - b);
   return rolls.slice(dropLowest).reduce((sum, v) => sum + v, 0);
 }
@@ -499,11 +548,9 @@ export class AttributeStep extends ProgressionStepPlugin {
   }
 
   _getPointBuySpent(attrs) {
-    return Object.entries(attrs).reduce((sum, [_key, value]) => {
-      if (!Number.isFinite(Number(value)) || Number(value) <= 0) return sum;
-      const score = Number(value);
-      return sum + ((POINT_BUY_COST[score] ?? POINT_BUY_COST[18]) - POINT_BUY_COST[POINT_BUY_BASE]);
-    }, 0);
+    let spent = 0;
+    for (const value of Object.values(attrs)) spent += pointBuySpend(value);
+    return spent;
   }
 
   _canAdjustPointBuy(attrs, key, delta, pool) {
@@ -511,13 +558,15 @@ export class AttributeStep extends ProgressionStepPlugin {
     const next = current + delta;
     if (next < POINT_BUY_BASE || next > 18) return false;
 
-    const clone = { ...attrs, [key]: next };
-    return this._getPointBuySpent(clone) <= pool;
+    // Only one score changes, so adjust the current spend by that score's
+    // cost difference instead of re-tallying a copied spread.
+    const spent = this._getPointBuySpent(attrs) - pointBuySpend(attrs[key]) + pointBuySpend(next);
+    return spent <= pool;
   }
 
   _modifier(score) {
     if (!Number.isFinite(Number(score))) return null;
-    return Math.floor((Number(score) - 10) / 2);
+    return (Number(score) - 10) >> 1;
   }
 
 
@@ -534,15 +583,7 @@ export class AttributeStep extends ProgressionStepPlugin {
   }
 
   _abilityName(key) {
-    const names = {
-      str: 'Strength',
-      dex: 'Dexterity',
-      con: 'Constitution',
-      int: 'Intelligence',
-      wis: 'Wisdom',
-      cha: 'Charisma',
-    };
-    return names[String(key || '').toLowerCase()] || String(key || '').toUpperCase();
+    return ABILITY_NAMES[String(key || '').toLowerCase()] || String(key || '').toUpperCase();
   }
 
   _abilityDescription(key) {
@@ -610,7 +651,7 @@ export class AttributeStep extends ProgressionStepPlugin {
     return {
       ...row,
       id: key,
-      label: String(row?.label || key).toUpperCase(),
+      label: abilityShortLabel(row?.label || key),
       fullName: row?.fullName || this._abilityName(key),
       colorClass: row?.colorClass || key,
       isExcluded: this._getExcludedSet(shell).has(key),
@@ -687,7 +728,7 @@ export class AttributeStep extends ProgressionStepPlugin {
 
     return this._decorateAbilityRow({
       id: key,
-      label: key.toUpperCase(),
+      label: abilityShortLabel(key),
       fullName: this._abilityName(key),
       isFocused: true,
       isUnassigned: !Number.isFinite(Number(finalScore)),
@@ -733,7 +774,7 @@ export class AttributeStep extends ProgressionStepPlugin {
     return {
       id: key,
       label: this._abilityName(key),
-      shortLabel: key.toUpperCase(),
+      shortLabel: abilityShortLabel(key),
       methodLabel: increaseMode ? 'Level Ability Increase' : this._methodCopy(this._method).label,
       canonicalDescription: this._abilityDescription(key),
       baseScore,
@@ -1027,10 +1068,20 @@ export class AttributeStep extends ProgressionStepPlugin {
   _areAllPooledAbilitiesAssigned(shell) {
     this._normalizePoolAssignments(shell);
     const slotsPerAbility = this._getAssignmentsPerAbility(shell);
-    return this._getAssignableAbilityKeys(shell).every((key) => {
-      const assigned = this._getAssignedPoolItems(key).length;
-      return assigned >= slotsPerAbility && Number.isFinite(Number(this._attributes?.[key]));
-    });
+
+    // Count assignments in one pass over the pool rather than filtering the
+    // pool again for every ability.
+    const assignedCounts = new Map();
+    for (const item of this._scorePool) {
+      const abilityKey = this._normalizeAbilityKey(item?.assignedTo);
+      if (abilityKey) assignedCounts.set(abilityKey, (assignedCounts.get(abilityKey) ?? 0) + 1);
+    }
+
+    for (const key of this._getAssignableAbilityKeys(shell)) {
+      if ((assignedCounts.get(this._normalizeAbilityKey(key)) ?? 0) < slotsPerAbility) return false;
+      if (!Number.isFinite(Number(this._attributes?.[key]))) return false;
+    }
+    return true;
   }
 
   _buildGeneratedValuesForCurrentMethod(shell) {
@@ -1216,41 +1267,12 @@ export class AttributeStep extends ProgressionStepPlugin {
     this._afterRenderAbortController = new AbortController();
     const signal = this._afterRenderAbortController.signal;
 
-    workSurfaceEl.querySelectorAll('.attr-method-btn').forEach(btn => {
-      btn.addEventListener('click', () => this._handleMethodChange(btn.dataset.method, shell), { signal });
-    });
-
-    workSurfaceEl.querySelectorAll('.attr-array-type-btn').forEach(btn => {
-      btn.addEventListener('click', () => this._handleArrayTypeChange(btn.dataset.arrayType, shell), { signal });
-    });
-
-    workSurfaceEl.querySelectorAll('[data-ability-row]').forEach(row => {
-      row.addEventListener('click', () => {
-        const abilityKey = String(row.dataset.abilityRow || '').toLowerCase();
-        this._focusedAbility = abilityKey;
-        if (this._method !== 'point-buy' && this._selectedPoolId) {
-          this._assignSelectedPoolToAbility(abilityKey, shell);
-        }
-        shell?.setFocusedItem?.(this._buildFocusedAbilityDetail(abilityKey, shell));
-        shell.requestRender({ preserveScroll: true, reason: 'attribute-step:afterRender' });
-      }, { signal });
-    });
-
-    workSurfaceEl.querySelectorAll('[data-ability][data-delta]').forEach(btn => {
-      btn.addEventListener('click', ev => {
-        ev.stopPropagation();
-        this._handlePointBuyDelta(btn.dataset.ability, Number(btn.dataset.delta), shell);
-      }, { signal });
-    });
+    // Clicks are delegated from the work surface. The handler checks the
+    // delta / clear / pool buttons before the row so a button nested inside
+    // an ability row is not also treated as a row click.
+    workSurfaceEl.addEventListener('click', ev => this._handleWorkSurfaceClick(ev, workSurfaceEl, shell), { signal });
 
     workSurfaceEl.querySelectorAll('[data-score-pool-id]').forEach(btn => {
-      btn.addEventListener('click', ev => {
-        ev.stopPropagation();
-        if (this._committed) return;
-        this._setSelectedPoolItem(btn.dataset.scorePoolId);
-        shell.requestRender({ preserveScroll: true, reason: 'attribute-step:afterRender' });
-      }, { signal });
-
       btn.addEventListener('dragstart', ev => {
         if (this._committed) return;
         const poolId = btn.dataset.scorePoolId;
@@ -1282,14 +1304,6 @@ export class AttributeStep extends ProgressionStepPlugin {
       }, { signal });
     });
 
-    workSurfaceEl.querySelectorAll('[data-clear-ability]').forEach(btn => {
-      btn.addEventListener('click', ev => {
-        ev.stopPropagation();
-        this._clearAbilityAssignment(btn.dataset.clearAbility, shell);
-        shell.requestRender({ preserveScroll: true, reason: 'attribute-step:afterRender' });
-      }, { signal });
-    });
-
     workSurfaceEl.querySelector('[data-attr-reroll]')?.addEventListener('click', () => {
       this._rerollCurrent(shell);
     }, { signal });
@@ -1301,6 +1315,64 @@ export class AttributeStep extends ProgressionStepPlugin {
 
   }
 
+  _handleWorkSurfaceClick(ev, workSurfaceEl, shell) {
+    // The delegated listener lives on the work-surface region element, which
+    // outlives this step's markup. It stays bound when navigation away fails
+    // and the step remains on screen, so instead of tearing it down on exit,
+    // ignore clicks while another step owns the surface.
+    if (!this._isCurrentStep(shell)) return;
+    const target = ev.target;
+    if (!(target instanceof Element)) return;
+    const match = selector => {
+      const el = target.closest(selector);
+      return el && workSurfaceEl.contains(el) ? el : null;
+    };
+
+    let el;
+    if ((el = match('[data-ability][data-delta]'))) {
+      ev.stopPropagation();
+      this._handlePointBuyDelta(el.dataset.ability, Number(el.dataset.delta), shell);
+      return;
+    }
+    if ((el = match('[data-clear-ability]'))) {
+      ev.stopPropagation();
+      this._clearAbilityAssignment(el.dataset.clearAbility, shell);
+      shell.requestRender({ preserveScroll: true, reason: 'attribute-step:afterRender' });
+      return;
+    }
+    if ((el = match('[data-score-pool-id]'))) {
+      ev.stopPropagation();
+      if (this._committed) return;
+      this._setSelectedPoolItem(el.dataset.scorePoolId);
+      shell.requestRender({ preserveScroll: true, reason: 'attribute-step:afterRender' });
+      return;
+    }
+    if ((el = match('.attr-method-btn'))) {
+      this._handleMethodChange(el.dataset.method, shell);
+      return;
+    }
+    if ((el = match('.attr-array-type-btn'))) {
+      this._handleArrayTypeChange(el.dataset.arrayType, shell);
+      return;
+    }
+    if ((el = match('[data-ability-row]'))) {
+      const abilityKey = String(el.dataset.abilityRow || '').toLowerCase();
+      this._focusedAbility = abilityKey;
+      if (this._method !== 'point-buy' && this._selectedPoolId) {
+        this._assignSelectedPoolToAbility(abilityKey, shell);
+      }
+      shell?.setFocusedItem?.(this._buildFocusedAbilityDetail(abilityKey, shell));
+      shell.requestRender({ preserveScroll: true, reason: 'attribute-step:afterRender' });
+    }
+  }
+
+  _isCurrentStep(shell) {
+    const current = shell?.steps?.[shell.currentStepIndex];
+    // No step list to compare against: the surface can only be this step's
+    if (!current) return true;
+    return current.stepId === this.descriptor?.stepId;
+  }
+
   _handleMethodChange(method, shell) {
     this._method = method;
     this._committed = false;
@@ -1313,7 +1385,7 @@ export class AttributeStep extends ProgressionStepPlugin {
       this._resetPooledMethod(shell, this._buildGeneratedValuesForCurrentMethod(shell));
     }
 
-    console.debug('[AttributeStep] method changed', {
+    swseLogger.debug('[AttributeStep] method changed', {
       method,
       attributes: this._attributes,
       scorePool: this._scorePool
@@ -1327,7 +1399,7 @@ export class AttributeStep extends ProgressionStepPlugin {
     if (this._method === 'array') {
       this._resetPooledMethod(shell, this._buildGeneratedValuesForCurrentMethod(shell));
     }
-    console.debug('[AttributeStep] array type changed', {
+    swseLogger.debug('[AttributeStep] array type changed', {
       arrayType,
       attributes: this._attributes,
       scorePool: this._scorePool
@@ -1382,7 +1454,7 @@ export class AttributeStep extends ProgressionStepPlugin {
       this._resetPooledMethod(shell, this._buildGeneratedValuesForCurrentMethod(shell));
     }
 
-    console.debug('[AttributeStep] rerolled current method', {
+    swseLogger.debug('[AttributeStep] rerolled current method', {
       method: this._method,
       attributes: this._attributes,
       scorePool: this._scorePool
@@ -1462,7 +1534,7 @@ export class AttributeStep extends ProgressionStepPlugin {
         const base = this._getActorAbilityBase(shell, key);
         const finalScore = base + (Number(increases[key] || 0) || 0);
         finalValues[key] = finalScore;
-        modifiers[key] = Math.floor((finalScore - 10) / 2);
+        modifiers[key] = (finalScore - 10) >> 1;
       }
       await this._commitNormalized(shell, 'attributes', {
         mode: 'levelup-ability-increase',
@@ -1489,7 +1561,7 @@ export class AttributeStep extends ProgressionStepPlugin {
       const base = Number(attributes?.[key] ?? 0) || 0;
       const finalScore = base + (Number(speciesMods?.[key] ?? 0) || 0);
       finalValues[key] = finalScore;
-      modifiers[key] = Math.floor((finalScore - 10) / 2);
+      modifiers[key] = (finalScore - 10) >> 1;
     }
     await this._commitNormalized(shell, 'attributes', {
       values: attributes,
@@ -1607,7 +1679,7 @@ export class AttributeStep extends ProgressionStepPlugin {
         const modifier = this._modifier(finalScore);
         return {
           id: key,
-          label: key.toUpperCase(),
+          label: abilityShortLabel(key),
           isFocused: this._focusedAbility === key,
           isUnassigned: false,
           baseDisplay: String(base),
@@ -1663,7 +1735,7 @@ export class AttributeStep extends ProgressionStepPlugin {
       value: item.value,
       isSelected: item.id === this._selectedPoolId,
       isUsed: !!item.assignedTo,
-      assignedLabel: item.assignedTo ? item.assignedTo.toUpperCase() : 'Available',
+      assignedLabel: item.assignedTo ? abilityShortLabel(item.assignedTo) : 'Available',
       assignedTo: item.assignedTo || null,
       isDraggable: !this._committed && this._method !== 'point-buy',
     }));
@@ -1684,7 +1756,7 @@ export class AttributeStep extends ProgressionStepPlugin {
 
       return {
         id: key,
-        label: key.toUpperCase(),
+        label: abilityShortLabel(key),
         isFocused: this._focusedAbility === key,
         isUnassigned: !hasBase && !excluded.has(key),
         baseDisplay: hasBase ? String(base) : '—',
@@ -12,6 +12,7 @@
 import { ProgressionStepPlugin } from './step-plugin-base.js';
 import { getStepGuidance, handleAskMentor } from './mentor-step-integration.js';
 import { swseLogger } from '/systems/foundryvtt-swse/scripts/utils/logger.js';
+import { loadChargenShared } from '/systems/foundryvtt-swse/scripts/apps/chargen/chargen-shared-loader.js';
 
 export class NameStep extends ProgressionStepPlugin {
   constructor(descriptor) {
@@ -172,7 +173,7 @@ export class NameStep extends ProgressionStepPlugin {
   async _generateRandomName(actor) {
     try {
       // Import and use shared data-driven random name generator
-      const { getRandomName } = await import('/systems/foundryvtt-swse/scripts/apps/chargen/chargen-shared.js');
+      const { getRandomName } = await loadChargenShared();
       if (typeof getRandomName === 'function') {
         return await getRandomName(actor);
       }
@@ -185,7 +186,7 @@ export class NameStep extends ProgressionStepPlugin {
   async _generateRandomDroidName(actor) {
     try {
       // Import and use shared data-driven droid designation generator
-      const { getRandomDroidName } = await import('/systems/foundryvtt-swse/scripts/apps/chargen/chargen-shared.js');
+      const { getRandomDroidName } = await loadChargenShared();
       if (typeof getRandomDroidName === 'function') {
         return await getRandomDroidName(actor);
       }
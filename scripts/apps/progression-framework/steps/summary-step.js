@@ -19,6 +19,7 @@ import { buildClassSkillKeySet, buildSkillDisplay, normalizeSkillKey } from '../
 import { ActorEngine } from '/systems/foundryvtt-swse/scripts/governance/actor-engine/actor-engine.js';
 import { RollEngine } from '/systems/foundryvtt-swse/scripts/engine/roll-engine.js';
 import { resolveLevelUpHitDie } from '/systems/foundryvtt-swse/scripts/apps/levelup/levelup-shared.js';
+import { loadChargenShared } from '/systems/foundryvtt-swse/scripts/apps/chargen/chargen-shared-loader.js';
 
 export class SummaryStep extends ProgressionStepPlugin {
   constructor(descriptor) {
@@ -1721,7 +1722,7 @@ export class SummaryStep extends ProgressionStepPlugin {
 
   async _generateRandomName(actor) {
     try {
-      const { getRandomName } = await import('/systems/foundryvtt-swse/scripts/apps/chargen/chargen-shared.js');
+      const { getRandomName } = await loadChargenShared();
       if (typeof getRandomName === 'function') return await getRandomName(actor);
     } catch (err) {
       swseLogger.warn('[SummaryStep] Failed to load shared random name generator:', err);
@@ -1731,7 +1732,7 @@ export class SummaryStep extends ProgressionStepPlugin {
 
   async _generateRandomDroidName(actor) {
     try {
-      const { getRandomDroidName } = await import('/systems/foundryvtt-swse/scripts/apps/chargen/chargen-shared.js');
+      const { getRandomDroidName } = await loadChargenShared();
       if (typeof getRandomDroidName === 'function') return await getRandomDroidName(actor);
     } catch (err) {
       swseLogger.warn('[SummaryStep] Failed to load shared random droid-name generator:', err);
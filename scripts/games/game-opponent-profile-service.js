@@ -7,11 +7,12 @@ import {
   resolvePazaakAiPersonality
 } from './games/pazaak/pazaak-ai-personalities.js';
 import { getGameSettingsSnapshot } from './game-settings.js';
+import { loadChargenShared } from '/systems/foundryvtt-swse/scripts/apps/chargen/chargen-shared-loader.js';
 
 export class GameOpponentProfileService {
   static async randomName(kind = 'living') {
     try {
-      const module = await import('/systems/foundryvtt-swse/scripts/apps/chargen/chargen-shared.js');
+      const module = await loadChargenShared();
       const picker = kind === 'droid' ? module?.getRandomDroidName : module?.getRandomName;
       if (typeof picker === 'function') {
         const name = await picker();
@@ -46,6 +46,25 @@ const NPC_SKILL_DEFS = [
 
 const NPC_SKILL_DEF_BY_KEY = Object.fromEntries(NPC_SKILL_DEFS.map(([key, label, ability]) => [key, { key, label, ability }]));
 
+// Statblock skill names (alphanumerics only, lowercased) -> system skill keys
+const NPC_SKILL_KEY_ALIASES = Object.freeze({
+  usecomputer: 'useComputer',
+  usetheforce: 'useTheForce',
+  gatherinformation: 'gatherInformation',
+  treatinjury: 'treatInjury',
+  knowledgebureaucracy: 'knowledgeBureaucracy',
+  knowledgegalacticlore: 'knowledgeGalacticLore',
+  knowledgelifesciences: 'knowledgeLifeSciences',
+  knowledgephysicalsciences: 'knowledgePhysicalSciences',
+  knowledgesocialsciences: 'knowledgeSocialSciences',
+  knowledgetactics: 'knowledgeTactics',
+  knowledgetechnology: 'knowledgeTechnology'
+});
+
+// "Perception +12" style statblock skill entries
+const NPC_STATBLOCK_SKILL_SEPARATOR = /[,;\n]+/;
+const NPC_STATBLOCK_SKILL_LINE = /^(.+?)\s+([+-]?\d+)/;
+
 
 function plainClone(value, fallback = {}) {
   if (value === null || value === undefined) return fallback;
@@ -427,22 +446,8 @@ function normalizeNpcDiceFormula(value) {
 function normalizeNpcSkillKey(value) {
   const raw = String(value ?? '').trim();
   if (!raw) return '';
-  const direct = raw.replace(/[^A-Za-z0-9]/g, '');
-  const lower = direct.toLowerCase();
-  const known = {
-    usecomputer: 'useComputer',
-    usetheforce: 'useTheForce',
-    gatherinformation: 'gatherInformation',
-    treatinjury: 'treatInjury',
-    knowledgebureaucracy: 'knowledgeBureaucracy',
-    knowledgegalacticlore: 'knowledgeGalacticLore',
-    knowledgelifesciences: 'knowledgeLifeSciences',
-    knowledgephysicalsciences: 'knowledgePhysicalSciences',
-    knowledgesocialsciences: 'knowledgeSocialSciences',
-    knowledgetactics: 'knowledgeTactics',
-    knowledgetechnology: 'knowledgeTechnology'
-  };
-  return known[lower] || raw;
+  const lower = raw.replace(/[^A-Za-z0-9]/g, '').toLowerCase();
+  return NPC_SKILL_KEY_ALIASES[lower] || raw;
 }
 
 
@@ -476,11 +481,11 @@ function parseNpcStatblockSkillLines(rawSkills = []) {
   const result = {};
   const rows = Array.isArray(rawSkills)
     ? rawSkills
-    : (typeof rawSkills === 'string' ? rawSkills.split(/[,;\n]+/) : []);
+    : (typeof rawSkills === 'string' ? rawSkills.split(NPC_STATBLOCK_SKILL_SEPARATOR) : []);
   for (const row of rows) {
     const text = String(row ?? '').replace(/ /g, ' ').trim();
     if (!text) continue;
-    const match = text.match(/^(.+?)\s+([+-]?\d+)/);
+    const match = NPC_STATBLOCK_SKILL_LINE.exec(text);
     if (!match) continue;
     const key = normalizeNpcSkillKey(match[1]);
     const total = Number(match[2]);
@@ -0,0 +1,228 @@
+import assert from 'node:assert/strict';
+import fs from 'node:fs';
+import path from 'node:path';
+import { fileURLToPath } from 'node:url';
+import { registerFoundryPathLoader } from './helpers/foundry-shim/register.mjs';
+import { installFoundryShimGlobals } from './helpers/foundry-shim/globals.mjs';
+
+// SWSE Progression — Attribute step delegated click listener lifecycle.
+//
+// The Attribute step's work-surface clicks (point-buy deltas, clear, pool
+// chips, method / array-type buttons, ability rows) are handled by ONE
+// delegated listener on the work-surface region element instead of a
+// listener per button. That element outlives the step's markup, so the
+// listener's lifetime matters:
+//
+//  - the shell calls onStepExit BEFORE it knows navigation will succeed.
+//    When the next step's onStepEnter throws (_activateStep restores the
+//    Attribute step and returns false) or no previous step applies,
+//    _onNextStep/_onPreviousStep return without a render and the Attribute
+//    surface stays on screen -- its listener must still work;
+//  - once another step really owns the surface, the stale listener must
+//    ignore clicks instead of acting on the next step's markup.
+//
+// These drive the REAL AttributeStep and the REAL ProgressionShell
+// navigation methods (_onNextStep / _onPreviousStep / _activateStep) on an
+// Object.create(ProgressionShell.prototype) double, with the shell helpers
+// that are not under test stubbed out.
+
+const ROOT = path.resolve(path.dirname(fileURLToPath(import.meta.url)), '..');
+const read = (rel) => fs.readFileSync(path.join(ROOT, rel), 'utf8');
+
+registerFoundryPathLoader();
+installFoundryShimGlobals();
+
+globalThis.window = globalThis.window ?? { addEventListener: () => {}, removeEventListener: () => {} };
+globalThis.localStorage = globalThis.localStorage ?? { getItem: () => null, setItem: () => {}, removeItem: () => {} };
+globalThis.document = globalThis.document ?? {
+  readyState: 'complete', addEventListener: () => {}, removeEventListener: () => {}, activeElement: null,
+};
+
+/** Minimal fake DOM element: closest() answers from a pre-wired selector
+ * map (the codebase's FakeElement fixture pattern, not a CSS engine). */
+class FakeElement {
+  constructor({ closest = {}, dataset = {} } = {}) {
+    this._closest = closest;
+    this.dataset = dataset;
+    this.listeners = [];
+    this.classList = { add() {}, remove() {}, toggle() {}, contains: () => false };
+  }
+  closest(sel) { return this._closest[sel] ?? null; }
+  contains() { return true; }
+  querySelector() { return null; }
+  querySelectorAll() { return []; }
+  addEventListener(type, fn, options = {}) { this.listeners.push({ type, fn, signal: options.signal ?? null }); }
+}
+globalThis.HTMLElement = globalThis.HTMLElement ?? FakeElement;
+globalThis.Element = FakeElement;
+globalThis.foundry.applications = globalThis.foundry.applications ?? {
+  api: {
+    ApplicationV2: class ApplicationV2Stub { async close() { return this; } },
+    HandlebarsApplicationMixin: (Base) => class extends Base {},
+    DocumentSheetV2: class DocumentSheetV2Stub {},
+    DialogV2: class DialogV2Stub {},
+  },
+  handlebars: { renderTemplate: async () => '' },
+  ux: { TextEditor: { implementation: { enrichHTML: async (v) => v } } },
+};
+
+const { ProgressionShell } = await import(
+  '/systems/foundryvtt-swse/scripts/apps/progression-framework/shell/progression-shell.js'
+);
+const { AttributeStep } = await import(
+  '/systems/foundryvtt-swse/scripts/apps/progression-framework/steps/attribute-step.js'
+);
+
+/** Click the work surface as if on the ability row for `abilityKey`,
+ * through every live (non-aborted) delegated click listener. */
+function clickAbilityRow(workSurfaceEl, abilityKey) {
+  const row = new FakeElement({ dataset: { abilityRow: abilityKey } });
+  const target = new FakeElement({ closest: { '[data-ability-row]': row } });
+  const ev = { target, stopPropagation() {}, preventDefault() {} };
+  for (const { type, fn, signal } of workSurfaceEl.listeners) {
+    if (type === 'click' && !signal?.aborted) fn(ev);
+  }
+}
+
+/** Shell double: real navigation methods, stubbed collaborators. */
+function buildShell(steps, plugins, currentStepIndex) {
+  const shell = Object.create(ProgressionShell.prototype);
+  const renders = [];
+  Object.assign(shell, {
+    steps,
+    stepPlugins: new Map(Object.entries(plugins)),
+    currentStepIndex,
+    isProcessing: false,
+    persistenceEnabled: false,
+    progressionSession: { currentStepId: steps[currentStepIndex].stepId, visitedStepIds: [] },
+    utilityBar: { setConfig() {} },
+    _stepActivationToken: 0,
+    renders,
+    requestRender(options) { renders.push(options); },
+    invalidateStepData() {},
+    _syncLegacyCommittedSelectionsFromSession() {},
+    _markStepCompleted() {},
+    _persistSessionSnapshot: async () => {},
+    _findNextApplicableStep: (start) => (start < steps.length ? start : -1),
+    _findPreviousApplicableStep: () => -1,
+    _syncMentorForStep() {},
+    _presentStepPluginGuidance() {},
+    _syncAskMentorState() {},
+  });
+  return shell;
+}
+
+async function mountAttributeStep(shell, attributeStep) {
+  const workSurfaceEl = new FakeElement();
+  // Validation is not under test; let navigation reach onStepExit.
+  attributeStep.getBlockingIssues = () => [];
+  await attributeStep.afterRender(shell, workSurfaceEl);
+  return workSurfaceEl;
+}
+
+const failingNextStep = {
+  async onStepEnter() { throw new Error('next step failed to enter'); },
+  async onStepExit() {},
+  getUtilityBarConfig: () => ({ mode: 'minimal' }),
+};
+
+/* ------------------------------------------------------------------ *
+ * Test 1 — Next fails because the next step's onStepEnter throws: the
+ * shell restores the Attribute step without rendering, and the still-
+ * visible Attribute surface keeps responding to clicks.
+ * ------------------------------------------------------------------ */
+{
+  const attributeStep = new AttributeStep({ stepId: 'attribute' });
+  const shell = buildShell(
+    [{ stepId: 'attribute' }, { stepId: 'next' }],
+    { attribute: attributeStep, next: failingNextStep },
+    0
+  );
+  const workSurfaceEl = await mountAttributeStep(shell, attributeStep);
+
+  await shell._onNextStep();
+
+  assert.equal(shell.currentStepIndex, 0, 'failed next-step entry must restore the Attribute step');
+  assert.equal(shell.renders.length, 0, 'failed navigation returns without a render -- the old surface stays on screen');
+
+  const listener = workSurfaceEl.listeners.find(l => l.type === 'click');
+  assert.ok(listener, 'afterRender must register the delegated work-surface click listener');
+  assert.ok(listener.signal, 'delegated click listener must be scoped to the step AbortController');
+  assert.equal(listener.signal.aborted, false, 'onStepExit on a failed navigation must not tear down the visible surface');
+
+  clickAbilityRow(workSurfaceEl, 'dex');
+  assert.equal(attributeStep._focusedAbility, 'dex', 'ability-row click was dropped after a failed Next');
+  assert.equal(shell.renders.length, 1, 'ability-row click must request a render');
+}
+
+/* ------------------------------------------------------------------ *
+ * Test 2 — Back finds no applicable earlier step: same contract.
+ * ------------------------------------------------------------------ */
+{
+  const attributeStep = new AttributeStep({ stepId: 'attribute' });
+  const shell = buildShell(
+    [{ stepId: 'intro' }, { stepId: 'attribute' }],
+    { attribute: attributeStep },
+    1
+  );
+  const workSurfaceEl = await mountAttributeStep(shell, attributeStep);
+
+  await shell._onPreviousStep();
+
+  assert.equal(shell.currentStepIndex, 1);
+  assert.equal(shell.renders.length, 0);
+  clickAbilityRow(workSurfaceEl, 'wis');
+  assert.equal(attributeStep._focusedAbility, 'wis', 'ability-row click was dropped after a blocked Back');
+}
+
+/* ------------------------------------------------------------------ *
+ * Test 3 — once another step really owns the shell, the Attribute step's
+ * still-bound listener ignores clicks on the shared surface.
+ * ------------------------------------------------------------------ */
+{
+  const attributeStep = new AttributeStep({ stepId: 'attribute' });
+  const nextStep = { ...failingNextStep, async onStepEnter() {} };
+  const shell = buildShell(
+    [{ stepId: 'attribute' }, { stepId: 'next' }],
+    { attribute: attributeStep, next: nextStep },
+    0
+  );
+  const workSurfaceEl = await mountAttributeStep(shell, attributeStep);
+
+  await shell._onNextStep();
+  assert.equal(shell.currentStepIndex, 1, 'successful navigation moves to the next step');
+  const rendersAfterNav = shell.renders.length;
+
+  clickAbilityRow(workSurfaceEl, 'cha');
+  assert.equal(attributeStep._focusedAbility, 'str', 'stale Attribute listener acted on another step\'s surface');
+  assert.equal(shell.renders.length, rendersAfterNav, 'stale Attribute listener requested a render');
+}
+
+/* ------------------------------------------------------------------ *
+ * Test 4 — afterRender replaces the previous render's listeners, every
+ * listener it registers carries the controller signal, and the delegated
+ * targets are not also wired per element.
+ * ------------------------------------------------------------------ */
+{
+  const attributeStep = new AttributeStep({ stepId: 'attribute' });
+  const shell = buildShell([{ stepId: 'attribute' }], { attribute: attributeStep }, 0);
+  const first = await mountAttributeStep(shell, attributeStep);
+  const second = await mountAttributeStep(shell, attributeStep);
+  assert.equal(first.listeners[0].signal.aborted, true, 'a re-render must abort the previous render\'s listeners');
+  assert.equal(second.listeners[0].signal.aborted, false);
+
+  const stepJs = read('scripts/apps/progression-framework/steps/attribute-step.js');
+  const start = stepJs.indexOf('\n  async afterRender(shell, workSurfaceEl) {');
+  assert.ok(start >= 0, 'AttributeStep.afterRender not found');
+  const afterRender = stepJs.slice(start, stepJs.indexOf('\n  }\n', start));
+  for (const selector of ['[data-ability][data-delta]', '[data-clear-ability]', '.attr-method-btn', '.attr-array-type-btn']) {
+    assert.ok(!afterRender.includes(`querySelectorAll('${selector}')`),
+      `afterRender wires ${selector} per element again -- clicks would fire twice`);
+  }
+  const registrations = afterRender.match(/addEventListener\(/g) ?? [];
+  const scoped = afterRender.match(/\{ signal \}\)/g) ?? [];
+  assert.equal(scoped.length, registrations.length,
+    `every afterRender listener must pass { signal } (${scoped.length}/${registrations.length} do)`);
+}
+
+console.log('progression-attribute-delegated-listener: all assertions passed');
@@ -1,4 +1,5 @@
 import os
+import re
 import shutil
 from datetime import datetime
 import base64
@@ -32,6 +33,9 @@ ASSET_DIR = os.path.join(
     ROOT, "assets", "ui"
 )
 
+# Trailing spaces/tabs before a line break (stripped from emitted text files)
+_TRAILING_WS = re.compile(r"[ \t]+(?=\n)")
+
 # -----------------------------------------------------------------------------
 # Utility Functions
 # -----------------------------------------------------------------------------
@@ -50,10 +54,21 @@ def backup(path):
         shutil.copy2(path, f"{path}.bak-{ts}")
 
 def write_text(path, text):
-    """Write a plain-text file such as HBS, CSS, JS."""
+    """Write a plain-text file such as HBS, CSS, JS.
+
+    Skips the backup and the write when the file on disk already holds the
+    same content, so re-running the installer does not churn mtimes or
+    invalidate Foundry's cached templates.
+    """
+    data = (_TRAILING_WS.sub("", text.strip()) + "\n").encode("utf-8")
+    if os.path.exists(path):
+        with open(path, "rb") as f:
+            if f.read() == data:
+                print(f"- Unchanged {path}")
+                return
     backup(path)
-    with open(path, "w", encoding="utf-8") as f:
-        f.write(text.strip() + "\n")
+    with open(path, "wb") as f:
+        f.write(data)
     print(f"✓ Wrote {path}")
 
 def write_binary(path, data_bytes):
@@ -391,14 +406,22 @@ NPC_CSS = r"""
 # =============================================================================
 
 NPC_JS = r"""
+// Explicit NPC role -> threat ring level (other roles fall back to "standard")
+const ROLE_THREAT_LEVEL = Object.freeze({
+  __proto__: null,
+  minion: "minion",
+  elite: "elite",
+  boss: "boss"
+});
+
 Hooks.on("ready", () => {
 
   Hooks.on("renderActorSheet", (sheet, html, data) => {
 
     if (!sheet.actor || sheet.actor.type !== "npc") return;
 
-    // Collapse logic
-    html.find(".npc-block-header").click(ev => {
+    // Collapse logic (one delegated listener for every block header)
+    html.on("click", ".npc-block-header", ev => {
       const block = ev.currentTarget.closest(".npc-block");
       block.classList.toggle("open");
     });
@@ -413,9 +436,7 @@ Hooks.on("ready", () => {
       let level = "standard";
 
       if (role) {
-        if (role == "minion") level = "minion";
-        else if (role == "elite") level = "elite";
-        else if (role == "boss") level = "boss";
+        level = ROLE_THREAT_LEVEL[role] ?? "standard";
       } else {
         if (cr <= 3) level = "minion";
         else if (cr <= 8) level = "standard";